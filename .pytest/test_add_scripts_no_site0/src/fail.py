@@ -0,0 +1,4 @@
+class Cli:
+    @staticmethod
+    def run():
+        return 3
@@ -0,0 +1 @@
+NAME = "pkg.sub"
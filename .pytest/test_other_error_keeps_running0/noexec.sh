@@ -0,0 +1 @@
+#!/bin/sh
@@ -0,0 +1,2 @@
+"""A package that contains models that represent entities.
+"""
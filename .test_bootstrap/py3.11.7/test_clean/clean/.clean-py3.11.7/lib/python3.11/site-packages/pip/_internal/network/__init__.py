@@ -0,0 +1,2 @@
+"""Contains purely network-related utilities.
+"""
@@ -0,0 +1,2 @@
+python = 'python2'
+description = 'Configurable bootstrap'
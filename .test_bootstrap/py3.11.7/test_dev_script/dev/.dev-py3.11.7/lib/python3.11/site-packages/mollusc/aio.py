@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import errno
+import functools
+import subprocess
+from mollusc import util
+from mollusc.sh import CommandFailed, CommandNotFound, Shell
+from subprocess import list2cmdline
+
+
+class AsyncShell(Shell):
+    async def call(self, cmd, check=True, **kwargs):
+        self._update_call_kwargs(kwargs)
+        cmdline = self._cmdline_echo(cmd, check, kwargs)
+        self.echo(cmdline)
+        proc = await self._exec(cmd, **kwargs)
+        returncode = await self._wait(proc, proc.wait())
+
+        if check and returncode:
+            self.flush()
+            raise CommandFailed(list2cmdline(cmd), subprocess.CalledProcessError(returncode, cmd))
+
+        return returncode
+
+    async def output(self, cmd, check=True, **kwargs):
+        self._update_call_kwargs(kwargs)
+        cmdline = self._cmdline_echo(cmd, check, kwargs)
+        self.echo('$({})'.format(cmdline))
+        proc = await self._exec(cmd, stdout=subprocess.PIPE, **kwargs)
+        output, _ = await self._wait(proc, proc.communicate())
+
+        if check and proc.returncode:
+            self.flush()
+            call_error = subprocess.CalledProcessError(proc.returncode, cmd, output)
+            raise CommandFailed(list2cmdline(cmd), call_error)
+
+        return output.decode(self.encoding)
+
+    async def _exec(self, cmd, **kwargs):
+        self.flush()
+
+        try:
+            return await asyncio.create_subprocess_exec(*cmd, **kwargs)
+        except EnvironmentError as e:
+            if e.errno == errno.ENOENT:
+                msg = 'Command {!r} not found, did you install it?'.format(cmd[0])
+                raise CommandNotFound(msg) from e
+            else:
+                raise
+
+    async def _wait(self, proc, awaitable):
+        # Don't leave the child running if the awaiting task is cancelled
+        try:
+            return await awaitable
+        except asyncio.CancelledError:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+
+            raise
+
+    async def remove(self, paths, echo=True):
+        await self._run_sync(super(AsyncShell, self).remove, paths, echo=echo)
+
+    async def glob(self, path):
+        return await self._run_sync(super(AsyncShell, self).glob, path)
+
+    async def write(self, path, data, echo=True, fsync=False):
+        await self._run_sync(super(AsyncShell, self).write, path, data, echo=echo, fsync=fsync)
+
+    async def _run_sync(self, func, *args, **kwargs):
+        # File system calls block too, run them in the default executor
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+util.make_object_module(locals(), AsyncShell())
@@ -0,0 +1,627 @@
+# -*- coding: utf-8 -*-
+import base64
+import collections
+import csv
+import getpass
+import hashlib
+import io
+import mmap
+import os
+import re
+import select
+import six
+import socket
+import sys
+import tarfile
+import time
+import uuid
+import zipfile
+import zlib
+from email.parser import Parser
+from mollusc import sh, util
+from os import path as osp
+from six.moves import http_client
+from six.moves.urllib.parse import urlsplit
+
+try:
+    from concurrent import futures
+except ImportError:  # Python 2 without the futures backport
+    futures = None
+
+READ_SIZE = 1024 * 1024
+CONNECT_ATTEMPTS = 3
+DIGESTS = ['md5', 'sha256', 'blake2_256']
+METADATA_MULTI_FIELDS = {
+    'classifier': 'classifiers',
+    'obsoletes': 'obsoletes',
+    'obsoletes_dist': 'obsoletes_dist',
+    'platform': 'platform',
+    'project_url': 'project_urls',
+    'provides': 'provides',
+    'provides_dist': 'provides_dist',
+    'provides_extra': 'provides_extra',
+    'requires': 'requires',
+    'requires_dist': 'requires_dist',
+    'requires_external': 'requires_external',
+    'supported_platform': 'supported_platform',
+}
+
+
+class NoCredentials(Exception):
+    pass
+
+
+class InvalidDistributions(Exception):
+    def __init__(self, results):
+        paths = [r['path'] for r in results if r['errors']]
+        super(InvalidDistributions, self).__init__('Invalid distributions: {}'.format(', '.join(paths)))
+        self.results = results
+
+
+class UploadFailed(Exception):
+    def __init__(self, path, status, reason):
+        super(UploadFailed, self).__init__('Uploading {!r} failed: {} {}'.format(path, status, reason))
+        self.path = path
+        self.status = status
+        self.reason = reason
+
+
+class Twine(object):
+    DEFAULT_REPO_URL = 'https://upload.pypi.org/legacy/'
+    # Twine options the in-process backend understands, others fall back
+    # to twine subprocess
+    HTTP_OPTIONS = {
+        '-c': 'comment',
+        '--comment': 'comment',
+    }
+
+    def __init__(self, username=None, password=None, repo_url=None, backend='http'):
+        self.username = username
+        self.password = password
+        self.repo_url = repo_url
+        self.backend = backend
+
+    def register(self, package, options={}):
+        if self.use_http(options):
+            with self.uploader() as uploader:
+                uploader.register(package, self.http_fields(options))
+        else:
+            self.call('register', package, options)
+
+    def upload(self, dist_files, options={}, validate=True):
+        dist_files = util.list_not_str(dist_files)
+        digests = {}
+
+        if validate:
+            results = validate_dist_files(dist_files)
+
+            if any(r['errors'] for r in results):
+                raise InvalidDistributions(results)
+
+            digests = dict((r['path'], r['digests']) for r in results)
+
+        if self.use_http(options):
+            with self.uploader() as uploader:
+                for path in dist_files:
+                    uploader.upload(path, self.http_fields(options), digests.get(path))
+        else:
+            self.call('upload', dist_files, options)
+
+    def use_http(self, options):
+        if self.backend != 'http':
+            return False
+
+        unknown = [name for name in options if name not in self.HTTP_OPTIONS]
+
+        if unknown:
+            sh.echo('Calling twine for options {}'.format(', '.join(sorted(unknown))))
+            return False
+
+        return True
+
+    def http_fields(self, options):
+        return [(self.HTTP_OPTIONS[name], value) for name, value in options.items()]
+
+    def uploader(self):
+        self.set_defaults()
+        self.prompt_password()
+        password = self.password
+
+        if not password and self.password_in_keyring:
+            import keyring
+            password = keyring.get_password(self.repo_url, self.username)
+
+        return LegacyUploader(self.repo_url, self.username, password or os.environ.get('TWINE_PASSWORD'))
+
+    def call(self, subcmd, args=[], options={}):
+        cmd = self.get_command(subcmd, args, options)
+        self.prompt_password()
+        env = os.environ.copy()
+
+        if self.password:
+            env['TWINE_PASSWORD'] = self.password
+
+        sh.call(cmd, env=env)
+
+    def prompt_password(self):
+        if os.environ.get('TWINE_PASSWORD'):
+            return
+
+        if not self.password and not self.password_in_keyring:
+            target = '{!r} in {!r}'.format(self.username, self.repo_url)
+            msg = 'Could not get password for {} from keyring'.format(target)
+
+            if sys.stdin.isatty():
+                sh.echo(msg)
+
+                while not self.password:
+                    self.password = getpass.getpass('Enter password for {}: '.format(target))
+            else:
+                raise NoCredentials(msg)
+
+    def set_defaults(self):
+        if not self.repo_url:
+            self.repo_url = self.DEFAULT_REPO_URL
+
+        if not self.username:
+            self.username = getpass.getuser()
+
+    def get_command(self, subcmd, args, options):
+        self.set_defaults()
+        cmd = [
+            'twine', subcmd,
+            '--repository-url', self.repo_url,
+            '-u', self.username
+        ]
+
+        for name, value in options.items():
+            cmd.append(name)
+            cmd.append(value)
+
+        cmd.extend(util.list_not_str(args))
+        return cmd
+
+    @property
+    def password_in_keyring(self):
+        if not hasattr(self, '_password_in_keyring'):
+            self._password_in_keyring = False
+
+            try:
+                import keyring
+            except ImportError:
+                sh.echo('Keyring is not installed', error=True)
+            else:
+                try:
+                    self._password_in_keyring = bool(keyring.get_password(self.repo_url, self.username))
+                except RuntimeError as e:
+                    sh.echo('keyring: {}'.format(e), error=True)
+
+        return self._password_in_keyring
+
+
+class LegacyUploader(object):
+    # Speaks the upload protocol of https://upload.pypi.org/legacy/ over one
+    # keep-alive connection, streaming each file from disk
+
+    def __init__(self, repo_url, username, password):
+        url = urlsplit(repo_url)
+
+        if url.scheme == 'https':
+            self.conn = http_client.HTTPSConnection(url.hostname, url.port)
+        elif url.scheme == 'http':
+            self.conn = http_client.HTTPConnection(url.hostname, url.port)
+        else:
+            raise ValueError('Unsupported repository URL {!r}'.format(repo_url))
+
+        self.url_path = url.path or '/'
+        credentials = '{}:{}'.format(username, password or '').encode('utf-8')
+        self.headers = {
+            'Authorization': 'Basic ' + base64.b64encode(credentials).decode('ascii'),
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def register(self, path, fields=()):
+        sh.echo('Registering {!r}'.format(osp.basename(path)))
+        fields = [(':action', 'submit')] + read_metadata(path) + list(fields)
+        self.post(path, fields)
+
+    def upload(self, path, fields=(), digests=None):
+        sh.echo('Uploading {!r}'.format(osp.basename(path)))
+        fields = [(':action', 'file_upload')] + read_metadata(path) + dist_file_type(path) + list(fields)
+        self.post(path, fields, path, digests)
+
+    def connect(self):
+        # An idle keep-alive connection closed by the server reads as EOF,
+        # reconnect before sending. Once the POST is on the wire it is not
+        # retried, the server may already have processed it
+        sock = self.conn.sock
+
+        if sock is not None and select.select([sock], [], [], 0)[0]:
+            self.conn.close()
+
+        if self.conn.sock is not None:
+            return
+
+        for attempt in range(CONNECT_ATTEMPTS):
+            try:
+                self.conn.connect()
+                return
+            except socket.error:
+                self.conn.close()
+
+                if attempt == CONNECT_ATTEMPTS - 1:
+                    raise
+
+                time.sleep(2 ** attempt)
+
+    def post(self, path, fields, content_file=None, digests=None):
+        self.connect()
+        response = self.send(fields, content_file, digests)
+        body = response.read()  # must be read for the connection to be reused
+
+        if not 200 <= response.status < 300:
+            reason = response.reason
+
+            if body and response.getheader('Content-Type', '').startswith('text/plain'):
+                reason = '{}: {}'.format(reason, body.decode('utf-8', 'replace').strip())
+
+            raise UploadFailed(path, response.status, reason)
+
+    def send(self, fields, content_file, digests):
+        # Fresh boundary per request so that no file content can contain it
+        boundary = uuid.uuid4().hex
+        head = b''.join(self.field_part(boundary, name, value) for name, value in fields)
+        tail = b'--' + boundary.encode('ascii') + b'--\r\n'
+        length = len(head) + len(tail)
+
+        if content_file:
+            content_head = self.part_header(boundary, 'content', osp.basename(content_file))
+            length += len(content_head) + os.path.getsize(content_file) + 2
+
+            # Digests go after the content so they are computed while streaming it
+            if digests is None:
+                hashes = new_hashes()
+                digest_length = sum(len(self.field_part(boundary, name + '_digest', '0' * (h.digest_size * 2)))
+                                    for name, h in hashes.items())
+            else:
+                hashes = None
+                digest_parts = b''.join(self.field_part(boundary, name + '_digest', digests[name])
+                                        for name in DIGESTS if name in digests)
+                digest_length = len(digest_parts)
+
+            length += digest_length
+
+        self.conn.putrequest('POST', self.url_path)
+
+        for name, value in self.headers.items():
+            self.conn.putheader(name, value)
+
+        self.conn.putheader('Content-Type', 'multipart/form-data; boundary=' + boundary)
+        self.conn.putheader('Content-Length', str(length))
+        self.conn.endheaders()
+        self.conn.send(head)
+
+        if content_file:
+            self.conn.send(content_head)
+
+            with open(content_file, 'rb') as f:
+                for chunk in iter(lambda: f.read(READ_SIZE), b''):
+                    if hashes:
+                        for h in hashes.values():
+                            h.update(chunk)
+
+                    self.conn.send(chunk)
+
+            self.conn.send(b'\r\n')
+
+            if hashes:
+                digest_parts = b''.join(self.field_part(boundary, name + '_digest', h.hexdigest())
+                                        for name, h in hashes.items())
+
+            self.conn.send(digest_parts)
+
+        self.conn.send(tail)
+        return self.conn.getresponse()
+
+    def part_header(self, boundary, name, filename=None):
+        disposition = 'form-data; name="{}"'.format(name)
+
+        if filename:
+            disposition += '; filename="{}"'.format(filename)
+
+        lines = ['--' + boundary, 'Content-Disposition: ' + disposition]
+
+        if filename:
+            lines.append('Content-Type: application/octet-stream')
+
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8')
+
+    def field_part(self, boundary, name, value):
+        if not isinstance(value, six.text_type):
+            value = str(value)
+
+        return self.part_header(boundary, name) + value.encode('utf-8') + b'\r\n'
+
+
+def validate_dist_files(paths, workers=None, echo=True):
+    # Each file is checked in its own process, hashing is CPU bound
+    paths = util.list_not_str(paths)
+
+    if futures is None or len(paths) < 2:
+        results = [validate_dist_file(path) for path in paths]
+    else:
+        with futures.ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(validate_dist_file, paths))
+
+    if echo:
+        echo_validation_table(results)
+
+    return results
+
+
+def echo_validation_table(results):
+    rows = [('file', 'size', 'sha256', 'result')]
+
+    for result in results:
+        rows.append((
+            osp.basename(result['path']),
+            str(result['size']),
+            result['digests'].get('sha256', '')[:12],
+            '; '.join(result['errors']) or 'OK'))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(3)]
+
+    for row in rows:
+        sh.echo('  '.join(c.ljust(w) for c, w in zip(row, widths)) + '  ' + row[3])
+
+
+def validate_dist_file(path):
+    result = {'path': path, 'size': 0, 'digests': {}, 'errors': []}
+    errors = result['errors']
+
+    try:
+        with open(path, 'rb') as f:
+            result['size'] = os.fstat(f.fileno()).st_size
+
+            if not result['size']:
+                errors.append('empty file')
+                return result
+
+            data = MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            hashes = new_hashes()
+
+            for h in hashes.values():
+                h.update(data)
+
+            result['digests'] = dict((name, h.hexdigest()) for name, h in hashes.items())
+
+            if path.endswith('.whl'):
+                metadata = validate_wheel(data, errors)
+            elif path.endswith('.tar.gz'):
+                metadata = validate_tar(data, errors)
+            elif path.endswith('.zip'):
+                metadata = validate_zip(data, errors)
+            else:
+                errors.append('unknown distribution type')
+                return result
+        finally:
+            data.close()
+
+        if metadata is None:
+            errors.append('no metadata')
+        else:
+            validate_metadata(path, metadata, errors)
+    except (IOError, OSError, EOFError, ValueError, zipfile.BadZipfile, tarfile.TarError, zlib.error) as e:
+        # Corrupt and truncated archives are reported, not raised
+        errors.append('{}: {}'.format(type(e).__name__, e))
+
+    return result
+
+
+class MappedFile(mmap.mmap):
+    # zipfile and tarfile ask before seeking, mmap only has seekable() in 3.13+
+    def seekable(self):
+        return True
+
+
+def validate_wheel(data, errors):
+    metadata = None
+
+    with zipfile.ZipFile(data) as z:
+        infos = dict((info.filename, info) for info in z.infolist())
+        dist_infos = [n for n in infos if n.count('/') == 1 and n.endswith('.dist-info/RECORD')]
+
+        if not dist_infos:
+            errors.append('no RECORD')
+            return None
+
+        dist_info = dist_infos[0][:-len('RECORD')]
+        record = z.read(dist_info + 'RECORD').decode('utf-8')
+        recorded = set()
+
+        for row in csv.reader(io.StringIO(record)):
+            if not row:
+                continue
+
+            name, digest, size = (row + ['', ''])[:3]
+            recorded.add(name)
+
+            if name not in infos:
+                errors.append('{}: missing'.format(name))
+                continue
+
+            try:
+                content = z.read(name)  # checks CRC
+            except (EOFError, zipfile.BadZipfile, zlib.error) as e:
+                errors.append('{}: {}'.format(name, e))
+                continue
+
+            if not digest:
+                if name != dist_info + 'RECORD':
+                    errors.append('{}: no hash in RECORD'.format(name))
+
+                continue
+
+            algorithm, _, expected = digest.partition('=')
+
+            try:
+                actual = hashlib.new(algorithm, content).digest()
+            except ValueError:
+                errors.append('{}: unknown hash {!r}'.format(name, algorithm))
+                continue
+
+            if base64.urlsafe_b64encode(actual).rstrip(b'=').decode('ascii') != expected:
+                errors.append('{}: hash mismatch'.format(name))
+            elif size and int(size) != len(content):
+                errors.append('{}: size mismatch'.format(name))
+
+        for name in infos:
+            if name not in recorded and not name.endswith('/') and not re.search(r'\.dist-info/RECORD\.(jws|p7s)$', name):
+                errors.append('{}: not in RECORD'.format(name))
+
+        if dist_info + 'METADATA' in infos:
+            metadata = z.read(dist_info + 'METADATA').decode('utf-8')
+
+    return metadata
+
+
+def validate_zip(data, errors):
+    with zipfile.ZipFile(data) as z:
+        bad = z.testzip()
+
+        if bad:
+            errors.append('{}: bad CRC'.format(bad))
+
+        names = [n for n in z.namelist() if n.count('/') == 1 and n.endswith('/PKG-INFO')]
+        return z.read(names[0]).decode('utf-8') if names else None
+
+
+def validate_tar(data, errors):
+    metadata = None
+
+    with tarfile.open(fileobj=data, mode='r:gz') as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+
+            # Reading everything checks the gzip CRC at the end
+            content = tar.extractfile(member).read()
+
+            if member.name.count('/') == 1 and member.name.endswith('/PKG-INFO'):
+                metadata = content.decode('utf-8')
+
+    return metadata
+
+
+def validate_metadata(path, text, errors):
+    message = Parser().parsestr(text)
+
+    for field in ['Metadata-Version', 'Name', 'Version']:
+        if not message.get(field):
+            errors.append('METADATA: no {}'.format(field))
+
+    if message.get('Name') and message.get('Version'):
+        # Filenames use escaped names, e.g. foo_bar-1.0.tar.gz for Foo-Bar 1.0,
+        # the version must match exactly
+        name, version = dist_file_name_version(path)
+
+        if normalize_name(name) != normalize_name(message['Name']) or version != message['Version']:
+            errors.append('METADATA: {} {} does not match filename'.format(message['Name'], message['Version']))
+
+
+def normalize_name(name):
+    # PEP 503
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+
+def dist_file_name_version(path):
+    filename = osp.basename(path)
+
+    if filename.endswith('.whl'):
+        # name-version(-build)?-pyversion-abi-platform.whl
+        parts = filename[:-4].split('-')
+        name, version = parts[0], parts[1] if len(parts) > 1 else ''
+    else:
+        base = re.sub(r'\.(tar\.gz|zip)$', '', filename)
+        name, _, version = base.rpartition('-')
+
+    return name, version
+
+
+def new_hashes():
+    hashes = [('md5', hashlib.md5()), ('sha256', hashlib.sha256())]
+
+    if hasattr(hashlib, 'blake2b'):
+        hashes.append(('blake2_256', hashlib.blake2b(digest_size=32)))
+
+    return collections.OrderedDict(hashes)
+
+
+def file_digests(path):
+    hashes = new_hashes()
+
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(READ_SIZE), b''):
+            for h in hashes.values():
+                h.update(chunk)
+
+    return dict((name, h.hexdigest()) for name, h in hashes.items())
+
+
+def dist_file_type(path):
+    filename = osp.basename(path)
+
+    if filename.endswith('.whl'):
+        # name-version(-build)?-pyversion-abi-platform.whl
+        return [('filetype', 'bdist_wheel'), ('pyversion', filename[:-4].split('-')[-3])]
+
+    if filename.endswith(('.tar.gz', '.zip')):
+        return [('filetype', 'sdist'), ('pyversion', 'source')]
+
+    raise ValueError('Unknown distribution file type {!r}'.format(path))
+
+
+def read_metadata_text(path):
+    if path.endswith('.tar.gz'):
+        with tarfile.open(path) as tar:
+            names = [m.name for m in tar.getmembers() if m.name.endswith('/PKG-INFO')]
+
+            if names:
+                return tar.extractfile(min(names, key=len)).read().decode('utf-8')
+    else:
+        with zipfile.ZipFile(path) as z:
+            if path.endswith('.whl'):
+                names = [n for n in z.namelist() if n.count('/') == 1 and n.endswith('.dist-info/METADATA')]
+            else:
+                names = [n for n in z.namelist() if n.endswith('/PKG-INFO')]
+
+            if names:
+                return z.read(min(names, key=len)).decode('utf-8')
+
+    raise ValueError('No metadata in {!r}'.format(path))
+
+
+def read_metadata(path):
+    message = Parser().parsestr(read_metadata_text(path))
+    fields = []
+
+    for key, value in message.items():
+        key = key.lower().replace('-', '_')
+        fields.append((METADATA_MULTI_FIELDS.get(key, key), value))
+
+    body = message.get_payload()
+
+    if body and body.strip() and 'description' not in message:
+        fields.append(('description', body))
+
+    return fields
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# Standalone (stdlib only), copied into site-packages by mollusc.venv and
+# imported from mollusc.pth at interpreter startup
+import json
+import os
+import sys
+from os import path as osp
+
+INDEX_FILE = 'mollusc-index.json'
+
+
+def module_name(entry, suffixes):
+    for suffix in suffixes:
+        if entry.endswith(suffix):
+            name = entry[:-len(suffix)]
+            # Extension modules like foo.cpython-37m-x86_64-linux-gnu.so
+            return name.split('.', 1)[0]
+
+    return None
+
+
+def dir_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def build_index(paths):
+    from importlib.machinery import all_suffixes
+
+    suffixes = sorted(all_suffixes(), key=len, reverse=True)
+    modules = {}
+    mtimes = {}
+
+    for path in paths:
+        mtimes[path] = dir_mtime(path)
+
+        try:
+            entries = os.listdir(path)
+        except OSError:
+            continue
+
+        for entry in entries:
+            if osp.isdir(osp.join(path, entry)):
+                name = entry  # regular or namespace package
+            else:
+                name = module_name(entry, suffixes)
+
+            if not name or not name.isidentifier():
+                continue
+
+            # Keep sys.path order so that the first dir wins, the rest are
+            # namespace package portions
+            dirs = modules.setdefault(name, [])
+
+            if path not in dirs:
+                dirs.append(path)
+
+    return {'paths': list(paths), 'mtimes': mtimes, 'modules': modules}
+
+
+def read_index(index_file):
+    try:
+        with open(index_file) as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def write_index(index_file, index):
+    tmp_file = '{}.{}.tmp'.format(index_file, os.getpid())
+
+    with open(tmp_file, 'w') as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+
+    os.rename(tmp_file, index_file)
+
+
+def is_stale(index):
+    return any(dir_mtime(path) != mtime for path, mtime in index['mtimes'].items())
+
+
+class IndexFinder(object):
+    def __init__(self, index_file):
+        self.index_file = index_file
+        self.index = read_index(index_file) or {'paths': [], 'mtimes': {}, 'modules': {}}
+        self.refresh()
+
+    def refresh(self):
+        if not is_stale(self.index):
+            return
+
+        self.index = build_index(self.index['paths'])
+
+        try:
+            write_index(self.index_file, self.index)
+        except (IOError, OSError):
+            pass  # read-only venv, rebuild again next time
+
+    def invalidate_caches(self):
+        self.refresh()
+
+    def find_spec(self, fullname, path=None, target=None):
+        # Submodules are found through their package's __path__
+        if path is not None:
+            return None
+
+        dirs = self.index['modules'].get(fullname)
+
+        if not dirs:
+            return None
+
+        from importlib.machinery import PathFinder
+        return PathFinder.find_spec(fullname, dirs, target)
+
+
+def install(index_file=None):
+    if index_file is None:
+        index_file = osp.join(osp.dirname(osp.abspath(__file__)), INDEX_FILE)
+
+    if sys.version_info < (3, 4):
+        # No find_spec(), plain sys.path entries like a normal .pth
+        index = read_index(index_file)
+
+        if index:
+            sys.path.extend(p for p in index['paths'] if p not in sys.path)
+
+        return None
+
+    for finder in sys.meta_path:
+        if isinstance(finder, IndexFinder) and finder.index_file == index_file:
+            return finder
+
+    finder = IndexFinder(index_file)
+    sys.meta_path.append(finder)
+    return finder
@@ -0,0 +1,1586 @@
+# -*- coding: utf-8 -*-
+import atexit
+import base64
+import binascii
+import codecs
+import collections
+import errno
+import fnmatch
+import functools
+import glob as globlib
+import hashlib
+import json
+import locale
+import multiprocessing
+import os
+import re
+import sys
+import shutil
+import six
+import stat
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from mollusc import util
+from os import path as osp
+from pprint import pformat
+from six.moves import queue
+from subprocess import list2cmdline
+
+try:
+    from concurrent import futures
+except ImportError:  # Python 2 without the futures backport
+    futures = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+DEFAULT_ENCODING = 'utf-8'
+READ_SIZE = 64 * 1024
+QUIET = 0
+NORMAL = 1
+VERBOSE = 2
+RAM_DIR = '/dev/shm'
+GLOB_MAGIC = re.compile('[*?[]')
+FICLONE = 0x40049409  # from linux/fs.h
+
+
+class ShellError(Exception):
+    pass
+
+
+class CommandFailed(ShellError):
+    def __init__(self, cmdline, call_error):
+        msg = 'Command {!r} failed with error code {!r}'.format(cmdline, call_error.returncode)
+        super(CommandFailed, self).__init__(msg)
+        self.output = call_error.output
+
+
+class PipelineFailed(CommandFailed):
+    def __init__(self, cmdline, call_error, stage):
+        msg = 'Command {!r} failed with error code {!r} in pipeline stage {}'.format(
+            cmdline, call_error.returncode, stage + 1)
+        ShellError.__init__(self, msg)
+        self.output = call_error.output
+        self.stage = stage
+
+
+class CommandNotFound(ShellError):
+    pass
+
+
+class SameFileError(ShellError):
+    def __init__(self, src, dst):
+        super(SameFileError, self).__init__('{!r} and {!r} are the same file'.format(src, dst))
+        self.src = src
+        self.dst = dst
+
+
+class CommandsFailed(ShellError):
+    def __init__(self, errors, results):
+        msg = '{} of {} commands failed:'.format(len(errors), len(results))
+        msg = '\n  '.join([msg] + [str(e) for e in errors])
+        super(CommandsFailed, self).__init__(msg)
+        self.errors = errors
+        self.results = results
+
+
+class OutputCache(object):
+    def __init__(self, maxsize=128, ttl=None, path=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = path
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, cmd, kwargs):
+        # Whatever comes from stdin can't be part of the key
+        if kwargs.get('stdin') is not None:
+            raise ValueError('Cannot cache output of a command reading from stdin')
+
+        env = kwargs.get('env')
+
+        if env is None:
+            env = os.environ
+
+        cmd_input = kwargs.get('input')
+
+        if isinstance(cmd_input, six.text_type):
+            cmd_input = cmd_input.encode('utf-8')
+
+        data = [
+            list(cmd),
+            osp.abspath(kwargs.get('cwd') or os.getcwd()),
+            sorted(env.items()),
+            kwargs.get('stderr') == subprocess.STDOUT,
+            hashlib.sha1(cmd_input).hexdigest() if cmd_input is not None else None,
+        ]
+        return hashlib.sha1(repr(data).encode('utf-8')).hexdigest()
+
+    def get(self, key, files=()):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+
+            if entry is None and self.path:
+                entry = self._load(key)
+
+            if entry is None:
+                return None
+
+            created, mtimes, output = entry
+            expired = self.ttl is not None and time.time() - created > self.ttl
+
+            if expired or mtimes != self._mtimes(files):
+                self._remove_file(key)
+                return None
+
+            self._entries[key] = entry  # most recently used goes last
+            return output
+
+    def set(self, key, output, files=()):
+        entry = (time.time(), self._mtimes(files), output)
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+            if self.path:
+                self._save(key, entry)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+            if self.path:
+                for path in globlib.glob(osp.join(self.path, '*.json')):
+                    os.remove(path)
+
+    def _mtimes(self, files):
+        mtimes = []
+
+        for path in util.list_not_str(files):
+            try:
+                mtimes.append(os.stat(path).st_mtime)
+            except OSError as e:
+                if e.errno == errno.ENOENT:
+                    mtimes.append(None)
+                else:
+                    raise
+
+        return mtimes
+
+    def _file(self, key):
+        return osp.join(self.path, '{}.json'.format(key))
+
+    def _load(self, key):
+        try:
+            with open(self._file(key)) as f:
+                data = json.load(f)
+        except (IOError, ValueError):
+            return None  # missing or corrupted, just a cache miss
+
+        return data['created'], data['mtimes'], base64.b64decode(data['output'])
+
+    def _save(self, key, entry):
+        created, mtimes, output = entry
+        data = {
+            'created': created,
+            'mtimes': mtimes,
+            'output': base64.b64encode(output).decode('ascii'),
+        }
+
+        try:
+            os.makedirs(self.path)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+        # Rename over the old entry so concurrent readers never see a partial file
+        fd, temp_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+
+        os.rename(temp_path, self._file(key))
+
+    def _remove_file(self, key):
+        if not self.path:
+            return
+
+        try:
+            os.remove(self._file(key))
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
+
+
+class DirSnapshot(object):
+    def __init__(self):
+        self._listings = {}
+        self._lock = threading.Lock()
+
+    def list_dir(self, path):
+        with self._lock:
+            listing = self._listings.get(path)
+
+        if listing is None:
+            listing = list(_scan_dir(path))
+
+            with self._lock:
+                self._listings[path] = listing
+
+        return listing
+
+    def clear(self):
+        with self._lock:
+            self._listings.clear()
+
+
+def _scan_dir(path):
+    # Yield (name, is_dir, is_link) of each entry, nothing if path cannot be listed
+    path = path or os.curdir
+
+    try:
+        if hasattr(os, 'scandir'):
+            for entry in os.scandir(path):
+                try:
+                    yield entry.name, entry.is_dir(), entry.is_symlink()
+                except OSError:
+                    yield entry.name, False, False
+        else:
+            for name in os.listdir(path):
+                entry_path = osp.join(path, name)
+                yield name, osp.isdir(entry_path), osp.islink(entry_path)
+    except OSError:
+        return
+
+
+class EchoBuffer(object):
+    def __init__(self, interval=0.1, max_size=64 * 1024):
+        self.interval = interval
+        self.max_size = max_size
+        self._queue = queue.Queue()
+        self._closed = False
+        self._error = None
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, file, s):
+        if self._thread.is_alive():
+            self._queue.put((file, s))
+        else:
+            file.write(s)  # writer died, see flush()
+
+    def flush(self):
+        if self._closed:
+            return
+
+        done = threading.Event()
+        self._queue.put((None, done))
+
+        # Don't wait forever if the writer thread died
+        while not done.wait(0.1):
+            if not self._thread.is_alive():
+                break
+
+        error, self._error = self._error, None
+
+        if error is not None:
+            six.reraise(*error)
+
+    def close(self):
+        if self._closed:
+            return
+
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self):
+        pending = []
+        size = 0
+        deadline = None
+
+        while True:
+            timeout = max(0, deadline - time.time()) if pending else None
+
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = (None, None)  # interval elapsed
+
+            if item is None:
+                self._write_pending(pending)
+                return
+
+            file, s = item
+
+            if file is None:
+                self._write_pending(pending)
+                pending, size = [], 0
+
+                if s is not None:
+                    s.set()
+
+                continue
+
+            if not pending:
+                deadline = time.time() + self.interval
+
+            pending.append((file, s))
+            size += len(s)
+
+            if size >= self.max_size:
+                self._write_pending(pending)
+                pending, size = [], 0
+
+    def _write_pending(self, pending):
+        # Keep the thread alive on e.g. BrokenPipeError, flush() re-raises it
+        try:
+            self._write(pending)
+        except Exception:
+            if self._error is None:
+                self._error = sys.exc_info()
+
+    def _write(self, pending):
+        # Join consecutive messages to the same file into one write
+        files = []
+        chunks = []
+
+        for file, s in pending:
+            if files and files[-1] is not file:
+                files[-1].write(''.join(chunks))
+                chunks = []
+
+            if not files or files[-1] is not file:
+                files.append(file)
+
+            chunks.append(s)
+
+        if chunks:
+            files[-1].write(''.join(chunks))
+
+        for file in set(files):
+            file.flush()
+
+
+class CommandTracer(object):
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def run(self, func, cmd, kwargs):
+        record = {
+            'argv': list(cmd),
+            'cwd': osp.abspath(kwargs.get('cwd') or os.getcwd()),
+            'thread': threading.current_thread().ident,
+            'start': time.time(),
+        }
+
+        def on_exit(proc):
+            record['wall'] = time.time() - record['start']
+            record['returncode'] = proc.returncode
+            rusage = proc.rusage
+
+            if rusage is not None:
+                record['user'] = rusage.ru_utime
+                record['sys'] = rusage.ru_stime
+                # Kilobytes on Linux, bytes on macOS
+                scale = 1 if sys.platform == 'darwin' else 1024
+                record['max_rss'] = rusage.ru_maxrss * scale
+
+            with self._lock:
+                self.records.append(record)
+
+        popen = functools.partial(_TracedPopen, on_exit=on_exit)
+
+        if func is subprocess.Popen:
+            return popen(cmd, **kwargs)
+
+        if func is subprocess.call:
+            return _popen_call(popen, cmd, False, **kwargs)
+
+        if func is subprocess.check_call:
+            return _popen_call(popen, cmd, True, **kwargs)
+
+        if func is subprocess.check_output:
+            return _popen_check_output(popen, cmd, **kwargs)
+
+        return func(cmd, **kwargs)  # traced by the inner calls, if any
+
+    def write_json_lines(self, path):
+        with open(path, 'w') as f:
+            for record in self.records:
+                f.write(json.dumps(record))
+                f.write('\n')
+
+    def write_chrome_trace(self, path):
+        pid = os.getpid()
+        events = []
+
+        for record in self.records:
+            events.append({
+                'name': list2cmdline(record['argv']),
+                'cat': 'command',
+                'ph': 'X',
+                'ts': int(record['start'] * 1e6),
+                'dur': int(record['wall'] * 1e6),
+                'pid': pid,
+                'tid': record['thread'],
+                'args': record,
+            })
+
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events}, f)
+
+    def summary(self, limit=10):
+        records = sorted(self.records, key=lambda r: r['wall'], reverse=True)[:limit]
+        lines = ['{:>9} {:>9} {:>9} {:>10}  {}'.format('wall', 'user', 'sys', 'max rss', 'command')]
+
+        def seconds(record, key):
+            return '{:.2f}s'.format(record[key]) if key in record else '-'
+
+        for record in records:
+            max_rss = '{:.1f}MB'.format(record['max_rss'] / 1048576.0) if 'max_rss' in record else '-'
+            lines.append('{:>9} {:>9} {:>9} {:>10}  {}'.format(
+                seconds(record, 'wall'), seconds(record, 'user'), seconds(record, 'sys'),
+                max_rss, list2cmdline(record['argv'])))
+
+        return '\n'.join(lines)
+
+
+class _TracedPopen(subprocess.Popen):
+    def __init__(self, *args, **kwargs):
+        self.on_exit = kwargs.pop('on_exit')
+        self.rusage = None
+        super(_TracedPopen, self).__init__(*args, **kwargs)
+
+    def wait(self, timeout=None, **kwargs):
+        if self.returncode is None:
+            self._wait4(timeout)
+
+        returncode = super(_TracedPopen, self).wait(**kwargs)
+
+        if self.on_exit is not None:
+            on_exit, self.on_exit = self.on_exit, None
+            on_exit(self)
+
+        return returncode
+
+    def _wait4(self, timeout=None):
+        # Same as waitpid() but also gets the resource usage of the child,
+        # polls with WNOHANG like Popen.wait() does for a timeout
+        deadline = None if timeout is None else time.time() + timeout
+        delay = 0.0005
+
+        while True:
+            try:
+                pid, status, rusage = os.wait4(self.pid, 0 if deadline is None else os.WNOHANG)
+            except OSError as e:
+                if e.errno == errno.EINTR:
+                    continue
+
+                if e.errno == errno.ECHILD:
+                    return  # already reaped, leave it to Popen
+
+                raise
+
+            if pid:
+                self.rusage = rusage
+                break
+
+            remaining = deadline - time.time()
+
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+
+            delay = min(delay * 2, remaining, 0.05)
+            time.sleep(delay)
+
+        if os.WIFSIGNALED(status):
+            self.returncode = -os.WTERMSIG(status)
+        else:
+            self.returncode = os.WEXITSTATUS(status)
+
+
+def _popen_call(popen, cmd, check, timeout=None, **kwargs):
+    proc = popen(cmd, **kwargs)
+
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except BaseException:
+        # Like subprocess.call(), including on TimeoutExpired
+        proc.kill()
+        proc.wait()
+        raise
+
+    if check and returncode:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+    return returncode
+
+
+def _popen_check_output(popen, cmd, input=None, timeout=None, **kwargs):
+    if input is not None:
+        kwargs['stdin'] = subprocess.PIPE
+
+    proc = popen(cmd, stdout=subprocess.PIPE, **kwargs)
+
+    try:
+        output, _ = proc.communicate(input, timeout=timeout)
+    except BaseException:
+        # Like subprocess.run(), including on TimeoutExpired
+        proc.kill()
+        proc.communicate()
+        raise
+
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output)
+
+    return output
+
+
+class Shell(object):
+    def __init__(self, stdout=sys.stdout, stderr=sys.stderr):
+        self.stdout = stdout
+        self.stderr = stderr
+        self.output_cache = OutputCache()
+        self.ram_dir = os.environ.get('MOLLUSC_RAM_DIR', RAM_DIR)
+
+        def get_enc(f):
+            return getattr(f, 'encoding', None)
+
+        self.encoding = get_enc(stdout) or get_enc(stderr) or DEFAULT_ENCODING
+        self.verbosity = NORMAL
+        self.tracer = None
+        self._echo_lock = threading.RLock()
+        self._echo_buffer = None
+
+    def echo(self, msg, error=False, end='\n', flush=True, level=None):
+        if level is None:
+            level = QUIET if error else NORMAL
+
+        if level > self.verbosity:
+            return  # not even formatting
+
+        s = self.format_message(msg)
+        file = self.stderr if error else self.stdout
+        echo_buffer = self._echo_buffer
+
+        if echo_buffer is not None:
+            echo_buffer.write(file, s + end)
+            return
+
+        with self._echo_lock:
+            six.print_(s, file=file, end=end, flush=flush)
+
+    def set_verbosity(self, level):
+        self.verbosity = level
+
+    def buffer_echo(self, interval=0.1, max_size=64 * 1024):
+        self.unbuffer_echo()
+        self._echo_buffer = EchoBuffer(interval, max_size)
+        return UnbufferEcho(self)
+
+    def unbuffer_echo(self):
+        echo_buffer, self._echo_buffer = self._echo_buffer, None
+
+        if echo_buffer is not None:
+            echo_buffer.close()
+
+    def flush(self):
+        echo_buffer = self._echo_buffer
+
+        if echo_buffer is not None:
+            echo_buffer.flush()
+
+    def format_message(self, msg):
+        if isinstance(msg, six.text_type):
+            return msg
+
+        if isinstance(msg, six.binary_type):
+            return msg.decode(self.encoding)
+
+        return pformat(msg)
+
+    def ensure_dir(self, path):
+        self.echo('Ensure dir {!r}'.format(path))
+
+        try:
+            os.makedirs(path)
+        except OSError as e:
+            if e.errno != errno.EEXIST or not osp.isdir(path):
+                raise
+
+        return path
+
+    @contextmanager
+    def temp_dir(self, pool=None, **kwargs):
+        if pool is not None:
+            with pool.temp_dir() as path:
+                yield path
+
+            return
+
+        path = self._make_temp_dir(**kwargs)
+        try:
+            yield path
+        finally:
+            self._remove_tree(path)
+
+    def temp_dir_pool(self, size=8, **kwargs):
+        return TempDirPool(self, size, **kwargs)
+
+    def _make_temp_dir(self, ram=False, min_free=0, **kwargs):
+        # Fall back to the default temp dir if RAM dir is missing or too full
+        if ram and 'dir' not in kwargs and self._has_free_space(self.ram_dir, min_free):
+            kwargs['dir'] = self.ram_dir
+
+        return tempfile.mkdtemp(**kwargs)
+
+    def _has_free_space(self, path, size):
+        try:
+            st = os.statvfs(path)
+        except (AttributeError, OSError):
+            return False
+
+        return os.access(path, os.W_OK) and st.f_bavail * st.f_frsize >= size
+
+    def working_dir(self):
+        return os.getcwd()
+
+    def change_dir(self, path):
+        self.echo('cd {!r}'.format(path))
+        unchanger = UnchangeDir(self, self.working_dir(), path)
+        os.chdir(path)
+        return unchanger
+
+    @contextmanager
+    def change_temp_dir(self, **kwargs):
+        with self.temp_dir(**kwargs) as path, self.change_dir(path):
+            yield path
+
+    def call(self, cmd, check=True, **kwargs):
+        self._update_call_kwargs(kwargs)
+        cmdline = self._cmdline_echo(cmd, check, kwargs)
+        self.echo(cmdline)
+        func = subprocess.check_call if check else subprocess.call
+        return self._call(func, cmd, **kwargs)
+
+    def output(self, cmd, check=True, cache=False, cache_files=(), **kwargs):
+        self._update_call_kwargs(kwargs)
+        cmdline = self._cmdline_echo(cmd, check, kwargs)
+
+        if cache:
+            key = self.output_cache.key(cmd, kwargs)
+            output = self.output_cache.get(key, cache_files)
+
+            if output is not None:
+                self.echo('$({})  # cached'.format(cmdline))
+                return output.decode(self.encoding)
+
+        self.echo('$({})'.format(cmdline))
+
+        try:
+            output = self._call(subprocess.check_output, cmd, **kwargs)
+        except CommandFailed as e:
+            if check:
+                raise
+            else:
+                output = e.output
+        else:
+            if cache:
+                self.output_cache.set(key, output, cache_files)
+
+        return output.decode(self.encoding)
+
+    def output_iter(self, cmd, check=True, **kwargs):
+        self._update_call_kwargs(kwargs)
+        cmdline = self._cmdline_echo(cmd, check, kwargs)
+        self.echo('$({})'.format(cmdline))
+        proc = self._call(subprocess.Popen, cmd, stdout=subprocess.PIPE, **kwargs)
+
+        try:
+            for line in self._iter_lines(proc.stdout):
+                yield line
+        except BaseException:
+            # Consumer stopped early or decoding failed, no one reads the rest
+            if proc.poll() is None:
+                proc.kill()
+
+            raise
+        finally:
+            proc.stdout.close()
+            returncode = proc.wait()
+
+        if check and returncode:
+            self.flush()
+            raise CommandFailed(list2cmdline(cmd), subprocess.CalledProcessError(returncode, cmd))
+
+    def _iter_lines(self, stream, errors='strict'):
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors)
+        pending = ''
+
+        while True:
+            chunk = os.read(stream.fileno(), READ_SIZE)
+            lines = (pending + decoder.decode(chunk, final=not chunk)).split('\n')
+            pending = lines.pop()
+
+            for line in lines:
+                yield line + '\n'
+
+            if not chunk:
+                break
+
+        if pending:
+            yield pending
+
+    def pipe(self, cmds, stdin=None, stdout=None, append=False, check=True, **kwargs):
+        self._update_call_kwargs(kwargs)
+        cmdline = ' | '.join([self._cmdline_echo(cmd, True, kwargs) for cmd in cmds])
+
+        if stdin is not None:
+            cmdline = '{} < {}'.format(cmdline, list2cmdline([stdin]))
+
+        if stdout is not None:
+            cmdline = '{} {} {}'.format(cmdline, '>>' if append else '>', list2cmdline([stdout]))
+
+        if not check:
+            cmdline = '({}) || true'.format(cmdline)
+
+        self.echo(cmdline)
+        procs = []
+        files = []
+        prev_stdout = None
+        last_stdout = None
+
+        try:
+            if stdin is not None:
+                prev_stdout = open(stdin, 'rb')
+                files.append(prev_stdout)
+
+            if stdout is not None:
+                last_stdout = open(stdout, 'ab' if append else 'wb')
+                files.append(last_stdout)
+
+            for index, cmd in enumerate(cmds):
+                is_last = index == len(cmds) - 1
+                proc = self._call(subprocess.Popen, cmd, stdin=prev_stdout,
+                                  stdout=last_stdout if is_last else subprocess.PIPE, **kwargs)
+
+                if procs:
+                    # Only the next stage holds the read end, so writers get SIGPIPE
+                    procs[-1].stdout.close()
+
+                procs.append(proc)
+                prev_stdout = proc.stdout
+        except BaseException:
+            for proc in procs:
+                if proc.poll() is None:
+                    proc.kill()
+
+                proc.wait()
+
+            raise
+        finally:
+            for f in files:
+                f.close()
+
+        returncodes = [proc.wait() for proc in procs]
+
+        if check:
+            # Like pipefail, the rightmost failed stage is reported
+            for index in reversed(range(len(cmds))):
+                if returncodes[index]:
+                    self.flush()
+                    call_error = subprocess.CalledProcessError(returncodes[index], cmds[index])
+                    raise PipelineFailed(list2cmdline(cmds[index]), call_error, index)
+
+        return returncodes
+
+    def call_many(self, cmds, check=True, workers=None, **kwargs):
+        def call(prefix, cmd, kwargs):
+            cmdline = self._cmdline_echo(cmd, check, kwargs)
+            self.echo('{}{}'.format(prefix, cmdline))
+            return self._call(self._call_prefixed, cmd, prefix=prefix, check=check, **kwargs)
+
+        return self._run_many(call, cmds, workers, kwargs)
+
+    def output_many(self, cmds, check=True, workers=None, **kwargs):
+        def output(prefix, cmd, kwargs):
+            cmdline = self._cmdline_echo(cmd, check, kwargs)
+            self.echo('{}$({})'.format(prefix, cmdline))
+
+            try:
+                output = self._call(subprocess.check_output, cmd, **kwargs)
+            except CommandFailed as e:
+                if check:
+                    raise
+                else:
+                    output = e.output
+
+            return output.decode(self.encoding)
+
+        return self._run_many(output, cmds, workers, kwargs)
+
+    def _run_many(self, func, cmds, workers, kwargs):
+        self._update_call_kwargs(kwargs)
+        cmds = list(cmds)
+        results = [None] * len(cmds)
+        errors = []
+        jobs = queue.Queue()
+
+        for index, cmd in enumerate(cmds):
+            jobs.put((index, cmd))
+
+        def work():
+            while True:
+                try:
+                    index, cmd = jobs.get_nowait()
+                except queue.Empty:
+                    return
+
+                prefix = '[{}] '.format(index + 1)
+
+                # Anything escaping would end this worker silently and leave
+                # its remaining jobs unrun
+                try:
+                    results[index] = func(prefix, cmd, dict(kwargs))
+                except BaseException as e:
+                    errors.append((index, e, sys.exc_info()))
+
+        workers = min(workers or multiprocessing.cpu_count(), len(cmds))
+        threads = [threading.Thread(target=work) for _ in range(workers)]
+
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            errors.sort(key=lambda item: item[0])
+
+            for _, e, exc_info in errors:
+                if not isinstance(e, Exception):  # KeyboardInterrupt etc
+                    six.reraise(*exc_info)
+
+            raise CommandsFailed([e for _, e, _ in errors], results)
+
+        return results
+
+    def _call_prefixed(self, cmd, prefix='', check=True, **kwargs):
+        echoed = []
+
+        for name in ('stdout', 'stderr'):
+            if kwargs.get(name) is None:
+                kwargs[name] = subprocess.PIPE
+                echoed.append(name)
+
+        proc = self._call(subprocess.Popen, cmd, **kwargs)
+        threads = []
+
+        for name in echoed:
+            args = (getattr(proc, name), prefix, name == 'stderr')
+            thread = threading.Thread(target=self._echo_lines, args=args)
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+
+        for thread in threads:
+            thread.join()
+
+        returncode = proc.wait()
+
+        if check and returncode:
+            raise subprocess.CalledProcessError(returncode, cmd)
+
+        return returncode
+
+    def _echo_lines(self, stream, prefix, error):
+        with stream:
+            for line in self._iter_lines(stream, errors='replace'):
+                line = line.rstrip('\r\n')
+                self.echo('{}{}'.format(prefix, line), error=error)
+
+    def trace(self, tracer=None, summary_at_exit=False):
+        self.tracer = tracer or CommandTracer()
+
+        if summary_at_exit:
+            tracer = self.tracer
+            atexit.register(lambda: self.echo(tracer.summary()))
+
+        return self.tracer
+
+    def untrace(self):
+        tracer, self.tracer = self.tracer, None
+        return tracer
+
+    def _update_call_kwargs(self, kwargs):
+        stderr_to_stdout = kwargs.pop('stderr_to_stdout', False)
+
+        if stderr_to_stdout:
+            kwargs['stderr'] = subprocess.STDOUT
+
+        # TODO: null_stdin
+
+    def _cmdline_echo(self, cmd, check, kwargs):
+        cmdline = list2cmdline(cmd)
+
+        if kwargs.get('stderr') == subprocess.STDOUT:
+            cmdline = '{} >&2'.format(cmdline)
+
+        if not check:
+            cmdline = '({}) || true'.format(cmdline)
+
+        return cmdline
+
+    def _call(self, func, cmd, **kwargs):
+        # Buffered messages must come before command output
+        self.flush()
+
+        try:
+            if self.tracer is None:
+                return func(cmd, **kwargs)
+
+            return self.tracer.run(func, cmd, kwargs)
+        except subprocess.CalledProcessError as e:
+            self.flush()
+            raise CommandFailed(list2cmdline(cmd), e)
+        except EnvironmentError as e:
+            if e.errno == errno.ENOENT:
+                msg = 'Command {!r} not found, did you install it?'.format(cmd[0])
+                six.raise_from(CommandNotFound(msg), e)
+            else:
+                raise
+
+    def path(self, *path, **kwargs):
+        rel = kwargs.pop('rel', None)
+
+        if kwargs:
+            raise TypeError('Unknown kwargs {!r}'.format(list(kwargs.keys())))
+
+        pathstr = osp.join(*path)
+
+        if rel is None:
+            return pathstr
+
+        if rel is True:
+            return osp.relpath(pathstr)
+
+        if rel is False:
+            return osp.abspath(pathstr)
+
+        return osp.relpath(pathstr, str(rel))
+
+    def write(self, path, data, echo=True, fsync=False):
+        if echo:
+            self.echo('Writing {!r}'.format(osp.relpath(path)))
+
+        path = self._write_atomic(path, data, fsync)
+
+        if fsync:
+            self._fsync_dir(osp.dirname(path))
+
+    def write_many(self, files, echo=True, fsync=False):
+        if hasattr(files, 'items'):
+            files = files.items()
+
+        dirs = []
+
+        for path, data in files:
+            if echo:
+                self.echo('Writing {!r}'.format(osp.relpath(path)))
+
+            dir_path = osp.dirname(self._write_atomic(path, data, fsync))
+
+            if dir_path not in dirs:
+                dirs.append(dir_path)
+
+        if fsync:
+            # Once per directory instead of once per file
+            for dir_path in dirs:
+                self._fsync_dir(dir_path)
+
+    def _write_atomic(self, path, data, fsync):
+        # Write to a temp file next to the target and rename it over, readers
+        # see either the old or the new content, never a partial file
+        path = osp.realpath(path)
+        temp_name = '.{}.{}.tmp'.format(osp.basename(path), binascii.hexlify(os.urandom(4)).decode('ascii'))
+        temp_path = osp.join(osp.dirname(path), temp_name)
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in self._iter_chunks(data):
+                    f.write(chunk)
+
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            try:
+                os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+            except OSError as e:
+                if e.errno != errno.ENOENT:
+                    raise
+
+            os.rename(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+            raise
+
+        return path
+
+    def _iter_chunks(self, data):
+        if isinstance(data, (six.text_type, six.binary_type)):
+            chunks = [data]
+        elif hasattr(data, 'read'):
+            chunks = iter(lambda: data.read(READ_SIZE), data.read(0))
+        else:
+            chunks = data
+
+        encoding = locale.getpreferredencoding(False)
+
+        for chunk in chunks:
+            if isinstance(chunk, six.text_type):
+                chunk = chunk.encode(encoding)
+
+            yield chunk
+
+    def _fsync_dir(self, path):
+        fd = os.open(path or os.curdir, os.O_RDONLY)
+
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def chmod_x(self, path, echo=True):
+        if echo:
+            self.echo('chmod +x {!r}'.format(osp.relpath(path)))
+
+        mode = os.stat(path).st_mode
+        os.chmod(path, mode | stat.S_IXGRP | stat.S_IXUSR | stat.S_IXOTH)
+
+    def remove(self, paths, echo=True, workers=None, progress=None):
+        if paths is None:
+            return
+
+        def rm(path):
+            if echo:
+                self.echo('Removing {!r}'.format(osp.relpath(path)))
+
+            try:
+                if osp.isdir(path) and not osp.islink(path):
+                    self._remove_tree(path, workers, progress)
+                else:
+                    os.remove(path)
+            except OSError as e:
+                if e.errno == errno.ENOENT:
+                    pass  # OK if not exists
+                else:
+                    raise
+
+        for path in util.list_not_str(paths):
+            rm(path)
+
+    def _remove_tree(self, path, workers=None, progress=None):
+        # Like shutil.rmtree() every directory is opened with O_NOFOLLOW and
+        # checked against the lstat() seen when listing its parent, so a
+        # directory swapped for a symlink while walking is never followed
+        safe_fd = (hasattr(os, 'O_NOFOLLOW') and hasattr(os, 'scandir') and os.scandir in os.supports_fd and
+                   os.unlink in os.supports_dir_fd)
+
+        if futures is None or not safe_fd:
+            shutil.rmtree(path)
+            return
+
+        removed = [0]
+        lock = threading.Lock()
+
+        def count(n):
+            # Called from worker threads too
+            if progress:
+                with lock:
+                    removed[0] += n
+                    progress(removed[0])
+
+        def open_dir(dir_path, expected):
+            fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW)
+
+            if not osp.samestat(os.fstat(fd), expected):
+                os.close(fd)
+                raise OSError(errno.ENOTDIR, 'Directory changed while removing it', dir_path)
+
+            return fd
+
+        def unlink_all(fd, names):
+            try:
+                for name in names:
+                    try:
+                        os.unlink(name, dir_fd=fd)
+                    except OSError as e:
+                        if e.errno != errno.ENOENT:
+                            raise
+            finally:
+                os.close(fd)
+
+            count(len(names))
+
+        # Walk in this thread and unlink the files of each directory in the
+        # pool, then remove directories children first once all files are gone.
+        # Subdirectories are only opened when popped, a wide tree would run
+        # out of fds otherwise
+        dirs = []
+        stack = [(path, os.lstat(path))]
+        max_pending = 256  # each pending task holds a directory fd
+
+        with futures.ThreadPoolExecutor(workers) as pool:
+            tasks = collections.deque()
+
+            while stack:
+                dir_path, expected = stack.pop()
+
+                try:
+                    fd = open_dir(dir_path, expected)
+                except OSError as e:
+                    if e.errno == errno.ENOENT:
+                        continue
+
+                    raise
+
+                names = []
+
+                try:
+                    for entry in os.scandir(fd):
+                        if entry.is_dir(follow_symlinks=False):
+                            try:
+                                stat = entry.stat(follow_symlinks=False)
+                            except OSError as e:
+                                if e.errno == errno.ENOENT:
+                                    continue
+
+                                raise
+
+                            stack.append((osp.join(dir_path, entry.name), stat))
+                        else:
+                            names.append(entry.name)
+                except BaseException:
+                    os.close(fd)
+                    raise
+
+                dirs.append(dir_path)
+
+                if names:
+                    tasks.append(pool.submit(unlink_all, fd, names))
+                else:
+                    os.close(fd)
+
+                while len(tasks) > max_pending:
+                    tasks.popleft().result()
+
+            for task in tasks:
+                task.result()
+
+        for dir_path in reversed(dirs):
+            try:
+                os.rmdir(dir_path)
+            except OSError as e:
+                if e.errno != errno.ENOENT:
+                    raise
+
+            count(1)
+
+    def glob(self, path, exclude=None, snapshot=None):
+        return list(self.iglob(path, exclude=exclude, snapshot=snapshot))
+
+    def iglob(self, patterns, exclude=None, snapshot=None):
+        exclude = util.list_not_str(exclude) or []
+        patterns = util.list_not_str(patterns)
+
+        # Only overlapping patterns or repeated ** can yield a path twice,
+        # don't keep every path of a big tree in memory otherwise
+        if len(patterns) > 1 or any(p.split(os.sep).count('**') > 1 for p in patterns):
+            seen = set()
+        else:
+            seen = None
+
+        for pattern in patterns:
+            if pattern.startswith(os.sep):
+                paths = self._glob_parts(os.sep, pattern.lstrip(os.sep).split(os.sep), snapshot)
+            else:
+                paths = self._glob_parts('', pattern.split(os.sep), snapshot)
+
+            for path in paths:
+                if seen is not None:
+                    if path in seen:
+                        continue
+
+                    seen.add(path)
+
+                if not any(fnmatch.fnmatch(path, ex) for ex in exclude):
+                    yield path
+
+    def _glob_parts(self, dir_path, parts, snapshot):
+        part, rest = parts[0], parts[1:]
+
+        if not part:  # empty part from 'a//b' or trailing slash
+            if rest:
+                for path in self._glob_parts(dir_path, rest, snapshot):
+                    yield path
+            elif osp.isdir(dir_path):
+                yield osp.join(dir_path, '')
+
+            return
+
+        if part == '**':
+            for path in self._glob_parts(dir_path, rest or ['*'], snapshot):
+                yield path
+
+            for name, is_dir, is_link in self._list_dir(dir_path, snapshot):
+                # Symlinks are not followed to avoid cycles
+                if is_dir and not is_link and not name.startswith('.'):
+                    for path in self._glob_parts(osp.join(dir_path, name), parts, snapshot):
+                        yield path
+
+            return
+
+        if not GLOB_MAGIC.search(part):
+            path = osp.join(dir_path, part)
+
+            if rest:
+                if osp.isdir(path):
+                    for path in self._glob_parts(path, rest, snapshot):
+                        yield path
+            elif osp.lexists(path):
+                yield path
+
+            return
+
+        match = re.compile(fnmatch.translate(part)).match
+
+        for name, is_dir, _ in self._list_dir(dir_path, snapshot):
+            if name.startswith('.') and not part.startswith('.'):
+                continue
+
+            if not match(name) or (rest and not is_dir):
+                continue
+
+            path = osp.join(dir_path, name)
+
+            if rest:
+                for path in self._glob_parts(path, rest, snapshot):
+                    yield path
+            else:
+                yield path
+
+    def _list_dir(self, path, snapshot):
+        if snapshot is None:
+            return _scan_dir(path)
+
+        return snapshot.list_dir(path)
+
+    def copy(self, src, dst, echo=True, link=False):
+        if osp.isdir(dst):
+            dst = osp.join(dst, osp.basename(src))
+
+        if echo:
+            self.echo('Copying {!r} to {!r}'.format(osp.relpath(src), osp.relpath(dst)))
+
+        self._copy_file(src, dst, link)
+        return dst
+
+    def copy_tree(self, src, dst, echo=True, link=False, workers=None):
+        if echo:
+            self.echo('Copying {!r} to {!r}'.format(osp.relpath(src), osp.relpath(dst)))
+
+        self._check_not_same(src, dst)
+
+        # Create directories and links here, copy files in the pool
+        jobs = []
+
+        for dir_path, dir_names, file_names in os.walk(src):
+            dst_dir = osp.normpath(osp.join(dst, osp.relpath(dir_path, src)))
+
+            try:
+                os.makedirs(dst_dir)
+            except OSError as e:
+                if e.errno != errno.EEXIST or not osp.isdir(dst_dir):
+                    raise
+
+            shutil.copymode(dir_path, dst_dir)
+
+            for name in dir_names + file_names:
+                src_path = osp.join(dir_path, name)
+                dst_path = osp.join(dst_dir, name)
+
+                if osp.islink(src_path):
+                    self._remove_file(dst_path)
+                    os.symlink(os.readlink(src_path), dst_path)
+                elif name in file_names:
+                    jobs.append((src_path, dst_path))
+
+        if futures is None:
+            for src_path, dst_path in jobs:
+                self._copy_file(src_path, dst_path, link)
+        else:
+            with futures.ThreadPoolExecutor(workers) as pool:
+                tasks = [pool.submit(self._copy_file, src_path, dst_path, link)
+                         for src_path, dst_path in jobs]
+
+                for task in tasks:
+                    task.result()
+
+        return dst
+
+    def move(self, src, dst, echo=True):
+        if osp.isdir(dst):
+            dst = osp.join(dst, osp.basename(src))
+
+        if echo:
+            self.echo('Moving {!r} to {!r}'.format(osp.relpath(src), osp.relpath(dst)))
+
+        try:
+            os.rename(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+            # Different file systems, copy then remove
+            if osp.islink(src):
+                self._remove_file(dst)
+                os.symlink(os.readlink(src), dst)
+            elif osp.isdir(src):
+                self.copy_tree(src, dst, echo=False)
+            else:
+                self._copy_file(src, dst)
+
+            self.remove(src, echo=False)
+
+        return dst
+
+    def _check_not_same(self, src, dst):
+        try:
+            src_stat = os.stat(src)
+            dst_stat = os.stat(dst)
+        except OSError as e:
+            if e.errno == errno.ENOENT:
+                return
+
+            raise
+
+        # A hard link to src is another name and may be replaced, src itself
+        # (through '.', a symlink or a single link) must not be removed
+        if osp.samestat(src_stat, dst_stat) and (src_stat.st_nlink == 1 or
+                                                 osp.realpath(src) == osp.realpath(dst)):
+            raise SameFileError(src, dst)
+
+    def _copy_file(self, src, dst, link=False):
+        self._check_not_same(src, dst)
+
+        # Never write into an existing dst, it could be a hard link to src
+        self._remove_file(dst)
+
+        if link:
+            try:
+                os.link(src, dst)
+                return
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                    raise
+
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            self._copy_data(fsrc.fileno(), fdst.fileno())
+
+        shutil.copymode(src, dst)
+
+    def _copy_data(self, in_fd, out_fd):
+        # Try the cheapest way first: reflink, then in-kernel copies, then userspace
+        if fcntl is not None and sys.platform.startswith('linux'):
+            try:
+                fcntl.ioctl(out_fd, FICLONE, in_fd)
+                return
+            except (IOError, OSError):
+                pass  # file system does not support reflink
+
+        size = os.fstat(in_fd).st_size
+
+        if hasattr(os, 'copy_file_range'):
+            def copy_range(offset):
+                return os.copy_file_range(in_fd, out_fd, size - offset, offset, offset)
+        elif hasattr(os, 'sendfile') and sys.platform.startswith('linux'):
+            def copy_range(offset):
+                return os.sendfile(out_fd, in_fd, offset, size - offset)
+        else:
+            copy_range = None
+
+        offset = 0
+
+        if copy_range is not None:
+            try:
+                while offset < size:
+                    copied = copy_range(offset)
+
+                    if not copied:
+                        break  # file shrank
+
+                    offset += copied
+
+                return
+            except OSError as e:
+                if offset or e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+
+        while True:
+            chunk = os.read(in_fd, READ_SIZE)
+
+            if not chunk:
+                break
+
+            view = memoryview(chunk)
+
+            while view:
+                view = view[os.write(out_fd, view):]
+
+    def _remove_file(self, path):
+        try:
+            os.remove(path)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
+
+    # TODO: basename, split_path, merge_path, split_ext, merge_ext
+    # TODO: is_file, is_dir, is_exec, is_readable, is_writable, etc
+    # TODO: test, validate
+    # TODO: list_dir
+
+
+class TempDirPool(object):
+    def __init__(self, sh, size=8, **kwargs):
+        self.sh = sh
+        self.size = size
+        self.kwargs = kwargs
+        self._free = []
+        self._in_use = 0
+        self._created = 0
+        self._reused = 0
+        self._discarded = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {
+                'created': self._created,
+                'reused': self._reused,
+                'discarded': self._discarded,
+                'free': len(self._free),
+                'in_use': self._in_use,
+            }
+
+    @contextmanager
+    def temp_dir(self):
+        path = self.acquire()
+        try:
+            yield path
+        finally:
+            self.release(path)
+
+    def acquire(self):
+        with self._lock:
+            if self._free:
+                self._in_use += 1
+                self._reused += 1
+                return self._free.pop()
+
+        # Count only once it exists, mkdtemp() may fail
+        path = self.sh._make_temp_dir(**self.kwargs)
+
+        with self._lock:
+            self._in_use += 1
+            self._created += 1
+
+        return path
+
+    def release(self, path):
+        keep = False
+
+        try:
+            if osp.isdir(path):
+                # Scrub instead of removing, the directory itself is recycled
+                for name, _, _ in list(_scan_dir(path)):
+                    self.sh.remove(osp.join(path, name), echo=False)
+
+                with self._lock:
+                    keep = len(self._free) < self.size
+
+                    if keep:
+                        self._free.append(path)
+        finally:
+            with self._lock:
+                self._in_use -= 1
+
+                if not keep:
+                    self._discarded += 1
+
+            if not keep:
+                self.sh.remove(path, echo=False)
+
+    def close(self):
+        with self._lock:
+            paths, self._free = self._free, []
+
+        self.sh.remove(paths, echo=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class UnbufferEcho(object):
+    def __init__(self, sh):
+        self.sh = sh
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.sh.unbuffer_echo()
+
+
+class UnchangeDir(object):
+    def __init__(self, sh, orig_dir, from_dir):
+        self.sh = sh
+        self.orig_dir = orig_dir
+        self.from_dir = from_dir
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.sh.echo('cd {!r}  # back from {!r}'.format(self.orig_dir, self.from_dir))
+        os.chdir(self.orig_dir)
+
+
+util.make_object_module(locals(), Shell())
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+import errno
+import json
+import sys
+from contextlib import contextmanager
+from mollusc import importindex, sh, util
+from os import path as osp
+
+INDEX_MODULE = 'mollusc_importindex'
+INDEX_LINE = 'import {0}; {0}.install()'.format(INDEX_MODULE)
+
+
+class VirtualEnv(object):
+    def __init__(self, prefix=sys.prefix, index=False):
+        self.prefix = prefix
+        self.index = index
+        self._batch_paths = None
+
+    @property
+    def site_packages_dir(self):
+        return osp.join(self.prefix, 'lib', 'python{}.{}'.format(*sys.version_info[:2]), 'site-packages')
+
+    @property
+    def paths_file(self):
+        return osp.join(self.site_packages_dir, 'mollusc.pth')
+
+    @property
+    def index_file(self):
+        return osp.join(self.site_packages_dir, importindex.INDEX_FILE)
+
+    @property
+    def index_module_file(self):
+        return osp.join(self.site_packages_dir, INDEX_MODULE + '.py')
+
+    def set_index(self, index):
+        # Resolve top-level modules of added paths through one meta path
+        # finder instead of probing each path as a sys.path entry
+        self.index = index
+
+    def add_path(self, path):
+        self.add_paths([path])
+
+    def add_paths(self, paths):
+        if self._batch_paths is not None:
+            all_paths = self._batch_paths
+        else:
+            all_paths = self.read_paths()
+
+        new_paths = [osp.abspath(str(p)) for p in paths if p]
+        new_paths = [p for p in new_paths if p not in all_paths]
+
+        if not new_paths:
+            return
+
+        all_paths.extend(new_paths)
+
+        if self._batch_paths is None:
+            self.write_paths(all_paths)
+
+    @contextmanager
+    def batch_paths(self):
+        # Read once, add_path() many times, write once
+        if self._batch_paths is not None:
+            yield  # nested
+            return
+
+        self._batch_paths = self.read_paths()
+        orig_paths = list(self._batch_paths)
+
+        try:
+            yield
+            paths = self._batch_paths
+        finally:
+            self._batch_paths = None
+
+        if paths != orig_paths:
+            self.write_paths(paths)
+
+    def read_paths(self):
+        paths = []
+
+        for line in self.read_pth_lines():
+            if line == INDEX_LINE:
+                index = importindex.read_index(self.index_file)
+                paths.extend(index['paths'] if index else [])
+            elif line:
+                paths.append(line)
+
+        return paths
+
+    def write_paths(self, paths):
+        sh.echo('Write paths to {!r}'.format(osp.relpath(self.paths_file)))
+        paths = [osp.abspath(str(path)) for path in paths if path]
+
+        if self.index:
+            self.write_index(paths)
+            sh.write(self.paths_file, INDEX_LINE + '\n', echo=False)
+        else:
+            sh.write(self.paths_file, ''.join('{}\n'.format(path) for path in paths), echo=False)
+            sh.remove([self.index_file, self.index_module_file], echo=False)
+
+    def write_index(self, paths):
+        if sys.version_info >= (3, 4):
+            index = importindex.build_index(paths)
+        else:
+            index = {'paths': paths, 'mtimes': {}, 'modules': {}}
+
+        sh.write(self.index_file, json.dumps(index, indent=2, sort_keys=True), echo=False)
+        sh.copy(osp.splitext(importindex.__file__)[0] + '.py', self.index_module_file, echo=False)
+
+    @property
+    def python(self):
+        return osp.join(self.prefix, 'bin', 'python')
+
+    def add_script(self, name, module, function, isolated=False, no_site=False):
+        self.add_scripts([(name, module, function)], isolated=isolated, no_site=no_site)
+
+    def add_scripts(self, scripts, isolated=False, no_site=False):
+        # Pin the venv python instead of /usr/bin/env lookup. With no_site
+        # skip site.py and restore its sys.path computed once for all scripts
+        options = ('I' if isolated else '') + ('S' if no_site else '')
+        shebang = '#!{}{}\n'.format(self.python, ' -' + options if options else '')
+        header = ['import sys\n']
+
+        if no_site:
+            header.append('sys.path[:] = {!r}\n'.format(self.site_sys_path(isolated)))
+
+            if INDEX_LINE in self.read_pth_lines():
+                header.append(INDEX_LINE + '\n')
+
+        for name, module, function in scripts:
+            script_file = osp.join(self.prefix, 'bin', name)
+            sh.echo('Add script {!r}'.format(osp.relpath(script_file)))
+            script = [shebang] + header + [
+                'from ', module, ' import ', function.split('.')[0], '\n\n',
+                "if __name__ == '__main__':\n",
+                '    sys.exit(', function, '())\n'
+            ]
+            sh.write(script_file, ''.join(script), echo=False)
+            sh.chmod_x(script_file, echo=False)
+
+    def add_console_scripts(self, projects=None, isolated=False, no_site=False):
+        try:
+            from importlib import metadata
+        except ImportError:
+            import importlib_metadata as metadata
+
+        scripts = []
+        seen = set()
+
+        for dist in metadata.distributions(path=[self.site_packages_dir]):
+            name = dist.metadata['Name']
+
+            # Like sys.path, the first one found shadows the rest
+            if name in seen or (projects is not None and name not in projects):
+                continue
+
+            seen.add(name)
+            entry_points = [ep for ep in dist.entry_points if ep.group == 'console_scripts']
+
+            for entry_point in sorted(entry_points, key=lambda ep: ep.name):
+                # module:attr [extras], ep.module/ep.attr are only in 3.9+
+                module, _, attr = entry_point.value.split('[')[0].partition(':')
+                scripts.append((entry_point.name, module.strip(), attr.strip()))
+
+        self.add_scripts(scripts, isolated=isolated, no_site=no_site)
+        return [name for name, _, _ in scripts]
+
+    def site_sys_path(self, isolated=False):
+        # Probe with the launcher's flags so that PYTHONPATH and user site
+        # of this process don't get pinned. Drop script dir and cwd entries,
+        # they differ per launch
+        flags = ['-I'] if isolated else ['-E', '-s']
+        code = 'import json, sys; print(json.dumps(sys.path[1:]))'
+        paths = json.loads(sh.output([self.python] + flags + ['-c', code]))
+        return [path for path in paths if path]
+
+    def read_pth_lines(self):
+        try:
+            with open(self.paths_file) as f:
+                return [line.strip() for line in f]
+        except IOError as e:
+            if e.errno == errno.ENOENT:
+                return []
+
+            raise
+
+util.make_object_module(locals(), VirtualEnv())
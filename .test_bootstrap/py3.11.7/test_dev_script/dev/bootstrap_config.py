@@ -0,0 +1,6 @@
+def post_bootstrap(**kwargs):
+    import chicken_and_egg
+    from mollusc import venv
+
+    venv.add_path('.')
+    venv.add_script('build-wheel', 'dev', 'build_wheel')
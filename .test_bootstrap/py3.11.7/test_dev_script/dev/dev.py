@@ -0,0 +1,10 @@
+import click
+import os
+from mollusc import sh
+from os import path as osp
+
+
+@click.command()
+def build_wheel():
+    os.chdir(osp.dirname(__file__))
+    sh.call(['python', 'setup.py', 'bdist_wheel'])
@@ -0,0 +1,2 @@
+"""For modules related to installing packages.
+"""